@@ -27,6 +27,11 @@ from .helpers import (
     as_constant,
     as_expression,
     as_constant_or_expression,
+    is_numeric,
+    compile_expression,
+    TimeDependentConstant,
+    ArrheniusFunction,
+    needs_update,
 )
 
 from .meshing.mesh import Mesh
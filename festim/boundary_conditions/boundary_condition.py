@@ -1,19 +1,27 @@
+import numpy as np
+
+
 class BoundaryCondition:
     """Base BoundaryCondition class
 
     Args:
-        surfaces (list or int): the surfaces of the BC
+        surfaces (list, tuple or int): the surfaces of the BC
         field (int or str): the field the boundary condition is
             applied to. 0 and "solute" stand for the mobile
             concentration, "T" for temperature
     """
 
     def __init__(self, surfaces, field) -> None:
-        if not isinstance(surfaces, list):
+        # normalised once here so that downstream code can rely on
+        # self.surfaces being a list of int
+        if np.ndim(surfaces) == 0:
             surfaces = [surfaces]
-        self.surfaces = surfaces
+        for surface in surfaces:
+            if int(surface) != surface:
+                raise ValueError("surfaces must be integers, got " + str(surface))
+        self.surfaces = [int(surface) for surface in surfaces]
 
-        if field == "solute":
+        if field in ["solute", "0"]:
             self.field = 0
         else:
             self.field = field
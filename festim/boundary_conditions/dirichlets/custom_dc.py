@@ -1,6 +1,8 @@
-from festim import DirichletBC, BoundaryConditionExpression
-import fenics as f
-import sympy as sp
+from festim import (
+    DirichletBC,
+    BoundaryConditionExpression,
+    as_constant_or_expression,
+)
 
 
 class CustomDirichlet(DirichletBC):
@@ -44,7 +46,4 @@ class CustomDirichlet(DirichletBC):
     def convert_prms(self):
         """Creates Expressions or Constant for all parameters"""
         for key, value in self.prms.items():
-            if isinstance(value, (int, float)):
-                self.prms[key] = f.Constant(value)
-            else:
-                self.prms[key] = f.Expression(sp.printing.ccode(value), t=0, degree=1)
+            self.prms[key] = as_constant_or_expression(value, degree=1)
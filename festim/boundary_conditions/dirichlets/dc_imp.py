@@ -1,18 +1,23 @@
-from festim import DirichletBC, BoundaryConditionExpression, k_B
-import fenics as f
+from festim import (
+    DirichletBC,
+    k_B,
+    as_constant_or_expression,
+    compile_expression,
+)
 import sympy as sp
 
 
 def dc_imp(T, phi, R_p, D_0, E_D, Kr_0=None, E_Kr=None, Kd_0=None, E_Kd=None, P=None):
-    D = D_0 * f.exp(-E_D / k_B / T)
-    value = phi * R_p / D
+    # 1/D and 1/Kr are written as exp(E/(k_B*T))/pre_exp instead of dividing
+    # by pre_exp*exp(-E/(k_B*T)), which saves a division
+    value = phi * R_p / D_0 * sp.exp(E_D / k_B / T)
     if Kr_0 is not None:
-        Kr = Kr_0 * f.exp(-E_Kr / k_B / T)
+        inv_Kr = sp.exp(E_Kr / k_B / T) / Kr_0
         if Kd_0 is not None:
-            Kd = Kd_0 * f.exp(-E_Kd / k_B / T)
-            value += ((phi + Kd * P) / Kr) ** 0.5
+            Kd = Kd_0 * sp.exp(-E_Kd / k_B / T)
+            value += ((phi + Kd * P) * inv_Kr) ** 0.5
         else:
-            value += (phi / Kr) ** 0.5
+            value += (phi * inv_Kr) ** 0.5
 
     return value
 
@@ -69,18 +74,18 @@ class ImplantationDirichlet(DirichletBC):
         self.P = P
 
     def create_expression(self, T):
-        phi = f.Expression(sp.printing.ccode(self.phi), t=0, degree=1)
-        R_p = f.Expression(sp.printing.ccode(self.R_p), t=0, degree=1)
+        phi = as_constant_or_expression(self.phi, degree=1)
+        R_p = as_constant_or_expression(self.R_p, degree=1)
         sub_expressions = [phi, R_p]
         if self.P is not None:
-            P = f.Expression(sp.printing.ccode(self.P), t=0, degree=1)
+            P = as_constant_or_expression(self.P, degree=1)
             sub_expressions.append(P)
         else:
             P = self.P
 
-        value_BC = BoundaryConditionExpression(
-            T,
+        value_BC = compile_expression(
             dc_imp,
+            T=T,
             phi=phi,
             R_p=R_p,
             D_0=self.D_0,
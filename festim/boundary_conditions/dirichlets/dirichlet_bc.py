@@ -1,5 +1,11 @@
-from festim import BoundaryCondition, k_B
+from festim import (
+    BoundaryCondition,
+    k_B,
+    as_constant_or_expression,
+    needs_update,
+)
 import fenics as f
+import numpy as np
 import sympy as sp
 
 
@@ -26,8 +32,7 @@ class DirichletBC(BoundaryCondition):
         Args:
             T (fenics.Function): temperature
         """
-        value_BC = sp.printing.ccode(self.value)
-        value_BC = f.Expression(value_BC, t=0, degree=4)
+        value_BC = as_constant_or_expression(self.value, degree=4)
         # TODO : why degree 4?
 
         self.expression = value_BC
@@ -44,7 +49,8 @@ class DirichletBC(BoundaryCondition):
         # TODO this requires changes for Henry's law
 
         # Store the non modified BC to be updated
-        self.sub_expressions.append(self.expression)
+        if needs_update(self.expression):
+            self.sub_expressions.append(self.expression)
         # create modified BC based on solubility
         expression_BC = BoundaryConditionTheta(
             self.expression, materials, volume_markers, T
@@ -77,9 +83,7 @@ class DirichletBC(BoundaryCondition):
         """
         self.dirichlet_bc = []
         self.create_expression(T)
-        # TODO: this should be more generic
-        mobile_fields = [0, "0", "solute"]
-        if self.field in mobile_fields and chemical_pot:
+        if self.field == 0 and chemical_pot:
             self.normalise_by_solubility(materials, volume_markers, T)
 
         # create a DirichletBC and add it to bcs
@@ -87,46 +91,120 @@ class DirichletBC(BoundaryCondition):
             funspace = V
         else:  # if only one field, use subspace
             funspace = V.sub(self.field)
-        for surface in self.surfaces:
-            bci = f.DirichletBC(funspace, self.expression, surface_markers, surface)
-            self.dirichlet_bc.append(bci)
+        markers, marker = self.merge_surfaces(surface_markers)
+        bci = f.DirichletBC(funspace, self.expression, markers, marker)
+        self.dirichlet_bc.append(bci)
 
+    def merge_surfaces(self, surface_markers):
+        """Returns facet markers and the marker of the facets of all
+        self.surfaces. If there are several surfaces, these facets are marked
+        with 1 in new facet markers so that only one fenics.DirichletBC is
+        needed.
 
-class BoundaryConditionTheta(f.UserExpression):
+        Args:
+            surface_markers (fenics.MeshFunction): the surface markers
+
+        Returns:
+            fenics.MeshFunction, int: the facet markers and the marker
+        """
+        if len(self.surfaces) == 1:
+            return surface_markers, self.surfaces[0]
+        merged_markers = f.MeshFunction(
+            "size_t", surface_markers.mesh(), surface_markers.dim(), 0
+        )
+        merged_markers.array()[np.isin(surface_markers.array(), self.surfaces)] = 1
+        return merged_markers, 1
+
+
+def solubility_normalisation(bci, T, S_0, E_S, henry):
+    S = S_0 * sp.exp(-E_S / k_B / T)
+    return sp.Piecewise(((bci / S + f.DOLFIN_EPS) ** 0.5, henry > 0.5), (bci / S, True))
+
+
+# C code of BoundaryConditionTheta, printed once
+SOLUBILITY_NORMALISATION_CCODE = sp.printing.ccode(
+    solubility_normalisation(*sp.symbols("bci T S_0 E_S henry"))
+)
+
+
+class BoundaryConditionTheta(f.Expression):
     """Creates an Expression for converting dirichlet bcs in the case
-    of chemical potential conservation
+    of chemical potential conservation.
+    The material properties are passed to the compiled Expression as DG0
+    functions.
 
     Args:
         bci (fenics.Expression): value of BC
-        mesh (fenics.mesh): mesh
         materials (festim.Materials): contains materials objects
         vm (fenics.MeshFunction): volume markers
         T (fenics.Function): Temperature
     """
 
     def __init__(self, bci, materials, vm, T, **kwargs):
-        super().__init__(kwargs)
+        S_0, E_S, henry = self.create_cell_properties(materials, vm)
+        kwargs.setdefault("degree", 2)
+        super().__init__(
+            SOLUBILITY_NORMALISATION_CCODE,
+            bci=bci,
+            T=T,
+            S_0=S_0,
+            E_S=E_S,
+            henry=henry,
+            **kwargs,
+        )
         self._bci = bci
         self._vm = vm
-        self._mesh = vm.mesh()
         self._T = T
         self._materials = materials
+        self._S_0 = S_0
+        self._E_S = E_S
+        self._henry = henry
 
-    def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._mesh, ufc_cell.index)
-        subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
-        S_0 = material.S_0
-        E_S = material.E_S
-        c = self._bci(x)
-        S = S_0 * f.exp(-E_S / k_B / self._T(x))
-        if material.solubility_law == "sievert":
-            value[0] = c / S
-        elif material.solubility_law == "henry":
-            value[0] = (c / S + f.DOLFIN_EPS) ** 0.5
+    def create_cell_properties(self, materials, vm):
+        """Creates DG0 functions of S_0, E_S and of a marker equal to 1 in
+        Henry materials and 0 elsewhere.
 
-    def value_shape(self):
-        return ()
+        Args:
+            materials (festim.Materials): contains materials objects
+            vm (fenics.MeshFunction): volume markers
+
+        Raises:
+            ValueError: if a cell doesn't belong to any material
+
+        Returns:
+            fenics.Function, fenics.Function, fenics.Function: S_0, E_S and
+                the Henry marker
+        """
+        mesh = vm.mesh()
+        subdomain_ids = vm.array()
+        properties = materials.property_arrays(
+            ["S_0", "E_S"], size=subdomain_ids.max(initial=0) + 1
+        )
+        S_0 = properties["S_0"][subdomain_ids]
+        E_S = properties["E_S"][subdomain_ids]
+        unknown_ids = subdomain_ids[np.isnan(S_0)]
+        if unknown_ids.size > 0:
+            raise ValueError(
+                "Couldn't find ID " + str(unknown_ids[0]) + " in materials list"
+            )
+        henry_ids = []
+        for material in materials:
+            if material.solubility_law == "henry":
+                henry_ids += material.ids
+        henry = np.isin(subdomain_ids, henry_ids).astype(float)
+
+        V = f.FunctionSpace(mesh, "DG", 0)
+        dofmap = V.dofmap()
+        cell_to_dof = dofmap.entity_dofs(mesh, mesh.topology().dim())
+        functions = []
+        for values in [S_0, E_S, henry]:
+            function = f.Function(V)
+            values_by_dof = np.zeros(function.vector().local_size())
+            values_by_dof[cell_to_dof] = values
+            function.vector().set_local(values_by_dof)
+            function.vector().apply("insert")
+            functions.append(function)
+        return functions
 
 
 class BoundaryConditionExpression(f.UserExpression):
@@ -1,10 +1,14 @@
-from festim import DirichletBC, BoundaryConditionExpression, k_B
-import fenics as f
+from festim import (
+    DirichletBC,
+    k_B,
+    as_constant_or_expression,
+    compile_expression,
+)
 import sympy as sp
 
 
 def henrys_law(T, H_0, E_H, pressure):
-    H = H_0 * f.exp(-E_H / k_B / T)
+    H = H_0 * sp.exp(-E_H / k_B / T)
     return H * pressure
 
 
@@ -25,10 +29,10 @@ class HenrysBC(DirichletBC):
         self.pressure = pressure
 
     def create_expression(self, T):
-        pressure = f.Expression(sp.printing.ccode(self.pressure), t=0, degree=1)
-        value_BC = BoundaryConditionExpression(
-            T,
+        pressure = as_constant_or_expression(self.pressure, degree=1)
+        value_BC = compile_expression(
             henrys_law,
+            T=T,
             H_0=self.H_0,
             E_H=self.E_H,
             pressure=pressure,
@@ -1,10 +1,14 @@
-from festim import DirichletBC, BoundaryConditionExpression, k_B
-import fenics as f
+from festim import (
+    DirichletBC,
+    k_B,
+    as_constant_or_expression,
+    compile_expression,
+)
 import sympy as sp
 
 
 def sieverts_law(T, S_0, E_S, pressure):
-    S = S_0 * f.exp(-E_S / k_B / T)
+    S = S_0 * sp.exp(-E_S / k_B / T)
     return S * pressure**0.5
 
 
@@ -25,10 +29,10 @@ class SievertsBC(DirichletBC):
         self.pressure = pressure
 
     def create_expression(self, T):
-        pressure = f.Expression(sp.printing.ccode(self.pressure), t=0, degree=1)
-        value_BC = BoundaryConditionExpression(
-            T,
+        pressure = as_constant_or_expression(self.pressure, degree=1)
+        value_BC = compile_expression(
             sieverts_law,
+            T=T,
             S_0=self.S_0,
             E_S=self.E_S,
             pressure=pressure,
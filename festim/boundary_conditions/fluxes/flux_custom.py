@@ -1,6 +1,4 @@
-from festim import FluxBC
-import sympy as sp
-import fenics as f
+from festim import FluxBC, as_constant_or_expression
 
 
 class CustomFlux(FluxBC):
@@ -36,7 +34,4 @@ class CustomFlux(FluxBC):
     def convert_prms(self):
         # create Expressions or Constant for all parameters
         for key, value in self.prms.items():
-            if isinstance(value, (int, float)):
-                self.prms[key] = f.Constant(value)
-            else:
-                self.prms[key] = f.Expression(sp.printing.ccode(value), t=0, degree=1)
+            self.prms[key] = as_constant_or_expression(value, degree=1)
@@ -1,6 +1,5 @@
-from festim import FluxBC, k_B
+from festim import FluxBC, k_B, as_constant_or_expression
 import fenics as f
-import sympy as sp
 
 
 class MassFlux(FluxBC):
@@ -23,8 +22,8 @@ class MassFlux(FluxBC):
         super().__init__(surfaces=surfaces, field=0)
 
     def create_form(self, T, solute):
-        h_coeff = f.Expression(sp.printing.ccode(self.h_coeff), t=0, degree=1)
-        c_ext = f.Expression(sp.printing.ccode(self.c_ext), t=0, degree=1)
+        h_coeff = as_constant_or_expression(self.h_coeff, degree=1)
+        c_ext = as_constant_or_expression(self.c_ext, degree=1)
 
         self.form = -h_coeff * (solute - c_ext)
         self.sub_expressions = [h_coeff, c_ext]
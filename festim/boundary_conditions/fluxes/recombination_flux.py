@@ -1,6 +1,5 @@
-from festim import FluxBC, k_B
+from festim import FluxBC, k_B, as_constant_or_expression, ArrheniusFunction
 import fenics as f
-import sympy as sp
 
 
 class RecombinationFlux(FluxBC):
@@ -21,12 +20,29 @@ class RecombinationFlux(FluxBC):
         self.Kr_0 = Kr_0
         self.E_Kr = E_Kr
         self.order = order
+        self.Kr = None
         super().__init__(surfaces=surfaces, field=0)
 
     def create_form(self, T, solute):
-        Kr_0_expr = f.Expression(sp.printing.ccode(self.Kr_0), t=0, degree=1)
-        E_Kr_expr = f.Expression(sp.printing.ccode(self.E_Kr), t=0, degree=1)
+        Kr_0_expr = as_constant_or_expression(self.Kr_0, degree=1)
+        E_Kr_expr = as_constant_or_expression(self.E_Kr, degree=1)
 
-        Kr = Kr_0_expr * f.exp(-E_Kr_expr / k_B / T)
-        self.form = -Kr * solute**self.order
         self.sub_expressions = [Kr_0_expr, E_Kr_expr]
+        self.Kr = None
+        if isinstance(T, f.Function) and all(
+            isinstance(prm, f.Constant) for prm in [Kr_0_expr, E_Kr_expr]
+        ):
+            # Kr is computed at the boundary dofs once per time step (see
+            # update()) instead of at each quadrature point
+            self.Kr = ArrheniusFunction(Kr_0_expr, E_Kr_expr, T)
+            Kr = self.Kr
+        else:
+            Kr = Kr_0_expr * f.exp(-E_Kr_expr / k_B / T)
+        self.form = -Kr * solute**self.order
+
+    def update(self):
+        """Updates Kr with the current temperature. Has to be called after the
+        temperature and the sub_expressions are updated.
+        """
+        if self.Kr is not None:
+            self.Kr.update()
@@ -1,4 +1,4 @@
-from festim import Concentration, FluxBC, k_B, RadioactiveDecay
+from festim import Concentration, FluxBC, k_B, RadioactiveDecay, needs_update
 from fenics import *
 
 
@@ -123,11 +123,8 @@ class Mobile(Concentration):
                         p_0 = trap.p_0
                         E_p = trap.E_p
                         density = trap.density[0]
-                    c_m, _ = self.get_concentration_for_a_given_material(mat, T)
                     F_trapping += (
-                        -k_0
-                        * exp(-E_k / k_B / T.T)
-                        * c_m
+                        self.get_arrhenius_times_concentration(-k_0, E_k, mat, T)
                         * (density - trap.solution)
                         * self.test_function
                         * dx(mat.id)
@@ -186,10 +183,12 @@ class Mobile(Concentration):
                 if isinstance(bc, FluxBC):
                     bc.create_form(T.T, solute)
                     # TODO : one day we will get rid of this huge expressions list
-                    expressions_fluxes += bc.sub_expressions
+                    expressions_fluxes += [
+                        expr for expr in bc.sub_expressions if needs_update(expr)
+                    ]
 
-                    for surf in bc.surfaces:
-                        F += -self.test_function * bc.form * ds(surf)
+                    # a single integral over all the surfaces of the BC
+                    F += -self.test_function * bc.form * ds(tuple(bc.surfaces))
         self.F_fluxes = F
         self.F += F
         self.sub_expressions += expressions_fluxes
@@ -197,5 +196,21 @@ class Mobile(Concentration):
     def get_concentration_for_a_given_material(self, material, T):
         return self.solution, self.previous_solution
 
+    def get_arrhenius_times_concentration(self, pre_exp, E, material, T):
+        """Returns pre_exp*exp(-E/(k_B*T)) * c where c is the mobile
+        concentration in a given material (eg. the trapping rate times c)
+
+        Args:
+            pre_exp (float): the pre-exponential factor
+            E (float): the activation energy (eV)
+            material (festim.Material): the material
+            T (festim.Temperature): the temperature
+
+        Returns:
+            ufl.algebra.Product: the product
+        """
+        c_m, _ = self.get_concentration_for_a_given_material(material, T)
+        return pre_exp * exp(-E / k_B / T.T) * c_m
+
     def mobile_concentration(self):
         return self.solution
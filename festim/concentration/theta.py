@@ -31,12 +31,13 @@ class Theta(Mobile):
         dx = f.Measure("dx", subdomain_data=self.volume_markers)
         F = 0
         for mat in self.materials:
-            S = mat.S_0 * f.exp(-mat.E_S / k_B / self.T.T)
+            # c/S with a single exponential and no division by exp
+            comp_over_S = comp / mat.S_0 * f.exp(mat.E_S / k_B / self.T.T)
             F += -prev_sol * v * dx(mat.id)
             if mat.solubility_law == "sievert":
-                F += comp / S * v * dx(mat.id)
+                F += comp_over_S * v * dx(mat.id)
             elif mat.solubility_law == "henry":
-                F += (comp / S) ** 0.5 * v * dx(mat.id)
+                F += comp_over_S**0.5 * v * dx(mat.id)
         f.solve(F == 0, prev_sol, bcs=[])
 
         f.assign(self.previous_solution, prev_sol)
@@ -66,6 +67,28 @@ class Theta(Mobile):
             c_0_n = self.previous_solution**2 * S_n
         return c_0, c_0_n
 
+    def get_arrhenius_times_concentration(self, pre_exp, E, material, T):
+        """Returns pre_exp*exp(-E/(k_B*T)) * c where c is the mobile
+        concentration in a given material. The exponential of the solubility
+        is combined with the one of the Arrhenius coefficient so that only
+        one exponential is evaluated.
+
+        Args:
+            pre_exp (float): the pre-exponential factor
+            E (float): the activation energy (eV)
+            material (festim.Material): the material with attributes S_0 and
+                E_S
+            T (festim.Temperature): the temperature
+
+        Returns:
+            ufl.algebra.Product: the product
+        """
+        coeff = pre_exp * material.S_0 * f.exp(-(E + material.E_S) / k_B / T.T)
+        if material.solubility_law == "sievert":
+            return coeff * self.solution
+        elif material.solubility_law == "henry":
+            return coeff * self.solution**2
+
     def mobile_concentration(self):
         """Returns the hydrogen concentration as c=theta*K_S or c=theta**2*K_H
         This is needed when adding robin BCs (eg RecombinationFlux).
@@ -178,13 +178,9 @@ class Trap(Concentration):
                     "Henry law of solubility is not implemented with traps"
                 )
 
-            c_0, c_0_n = mobile.get_concentration_for_a_given_material(mat, T)
-
             # k(T)*c_m*(n - c_t) - p(T)*c_t
             F_trapping += (
-                -k_0
-                * exp(-E_k / k_B / T.T)
-                * c_0
+                mobile.get_arrhenius_times_concentration(-k_0, E_k, mat, T)
                 * (density - solution)
                 * test_function
                 * dx(mat.id)
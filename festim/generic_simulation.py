@@ -2,6 +2,7 @@ import festim
 from festim.h_transport_problem import HTransportProblem
 from fenics import *
 import numpy as np
+import linecache
 import warnings
 
 
@@ -202,15 +203,15 @@ class Simulation:
         self.T.boundary_conditions = []
         self.h_transport_problem.boundary_conditions = []
 
-        valid_fields = (
-            ["T", 0, "0"]  # temperature and mobile concentration
-            + [str(i + 1) for i, _ in enumerate(self.traps)]
-            + [i + 1 for i, _ in enumerate(self.traps)]
-        )
+        valid_fields = {"T", 0}  # temperature and mobile concentration
+        for i, _ in enumerate(self.traps, 1):
+            valid_fields.update([i, str(i)])
 
-        # collect all DirichletBCs
+        # collect all DirichletBCs and their surfaces
         dc_bcs = [
-            bc for bc in self.boundary_conditions if isinstance(bc, festim.DirichletBC)
+            (bc, set(bc.surfaces))
+            for bc in self.boundary_conditions
+            if isinstance(bc, festim.DirichletBC)
         ]
 
         for bc in self.boundary_conditions:
@@ -222,16 +223,17 @@ class Simulation:
                 self.h_transport_problem.boundary_conditions.append(bc)
             # checks that DirichletBC is not set with another bc on the same surface
             # iterate through all BCs
-            for dc_bc in dc_bcs:
+            bc_surfaces = set(bc.surfaces)
+            for dc_bc, dc_bc_surfaces in dc_bcs:
                 if (
                     bc == dc_bc or bc.field != dc_bc.field
                 ):  # skip if the same BC or different fields
                     continue
                 # check if BCs share the same surfaces using the set().isdisjoint() method
                 # that returns True if the first set has no elements in common with other containers
-                if not set(bc.surfaces).isdisjoint(dc_bc.surfaces):
-                    # convert lists of surfaces to sets and obtain their intersection
-                    intersection = set(bc.surfaces) & set(dc_bc.surfaces)
+                if not bc_surfaces.isdisjoint(dc_bc_surfaces):
+                    # obtain the intersection of the sets of surfaces
+                    intersection = bc_surfaces & dc_bc_surfaces
                     raise ValueError(
                         f"A DirichletBC is simultaneously set with another boundary condition on surfaces {intersection} for field {dc_bc.field}"
                     )
@@ -288,15 +290,19 @@ class Simulation:
         self.materials.create_properties(self.mesh.volume_markers, self.T.T)
         self.materials.create_solubility_law_markers(self.mesh)
 
-        # if the temperature is not time-dependent, solubility can be projected
+        # solubility is projected once per time step instead of being
+        # evaluated at every point during assembly
         if self.settings.chemical_pot:
             # TODO this could be moved to Materials.create_properties()
-            if self.T.is_steady_state():
-                # self.materials.S = project(self.materials.S, self.V_DG1)
-                self.materials.solubility_as_function(self.mesh, self.T.T)
+            self.materials.solubility_as_function(self.mesh, self.T.T)
 
         self.h_transport_problem.initialise(self.mesh, self.materials, self.dt)
 
+        # sympy.lambdify (see festim.TimeDependentConstant) stores the
+        # generated source in linecache, clear it once all the BCs are built
+        # to avoid a memory leak
+        linecache.clearcache()
+
         self.exports.initialise_derived_quantities(
             self.mesh.dx, self.mesh.ds, self.materials
         )
@@ -376,6 +382,9 @@ class Simulation:
         self.t += float(self.dt.value)
         # update temperature
         self.T.update(self.t)
+        # update solubility
+        if self.settings.chemical_pot and not self.T.is_steady_state():
+            self.materials.update_solubility()
         # update H problem
         self.h_transport_problem.update(self.t, self.dt)
 
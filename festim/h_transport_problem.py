@@ -120,11 +120,12 @@ class HTransportProblem:
             self.mobile.previous_solution = self.u_n
             self.mobile.test_function = self.v
         else:
+            test_functions = split(self.v)
             for i, concentration in enumerate([self.mobile, *self.traps]):
                 concentration.solution = self.u.sub(i)
                 # concentration.solution = list(split(self.u))[i]
                 concentration.previous_solution = self.u_n.sub(i)
-                concentration.test_function = list(split(self.v))[i]
+                concentration.test_function = test_functions[i]
 
         print("Defining initial values")
         field_to_component = {
@@ -168,9 +169,11 @@ class HTransportProblem:
         # this is needed to correctly create the formulation
         # TODO: write a test for this?
         if self.V.num_sub_spaces() != 0:
+            previous_solutions = split(self.u_n)
+            solutions = split(self.u)
             for i, concentration in enumerate([self.mobile, *self.traps]):
-                concentration.previous_solution = list(split(self.u_n))[i]
-                concentration.solution = list(split(self.u))[i]
+                concentration.previous_solution = previous_solutions[i]
+                concentration.solution = solutions[i]
 
     def define_variational_problem(self, materials, mesh, dt=None):
         """Creates the variational problem for hydrogen transport (form,
@@ -225,8 +228,11 @@ class HTransportProblem:
                     volume_markers=mesh.volume_markers,
                 )
                 self.bcs += bc.dirichlet_bc
-                self.expressions += bc.sub_expressions
-                self.expressions.append(bc.expression)
+                self.expressions += [
+                    expr for expr in bc.sub_expressions if festim.needs_update(expr)
+                ]
+                if festim.needs_update(bc.expression):
+                    self.expressions.append(bc.expression)
 
     def compute_jacobian(self):
         du = TrialFunction(self.u.function_space())
@@ -241,6 +247,9 @@ class HTransportProblem:
         """
 
         festim.update_expressions(self.expressions, t)
+        for bc in self.boundary_conditions:
+            if isinstance(bc, festim.RecombinationFlux):
+                bc.update()
 
         converged = False
         u_ = Function(self.u.function_space())
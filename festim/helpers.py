@@ -1,7 +1,9 @@
 import festim
+import functools
 import xml.etree.ElementTree as ET
-from fenics import Expression, UserExpression, Constant
+from fenics import Expression, UserExpression, Constant, Function, DirichletBC
 import sympy as sp
+import numpy as np
 
 
 def update_expressions(expressions, t):
@@ -17,14 +19,53 @@ def update_expressions(expressions, t):
     return expressions
 
 
-def as_expression(expr):
+@functools.lru_cache(maxsize=256, typed=True)
+def _cached_ccode(expr):
+    return sp.printing.ccode(expr)
+
+
+def _ccode(expr):
+    """Memoized sp.printing.ccode. sympy expressions are immutable and
+    hashable so they can be used as keys directly. Unhashable inputs are
+    printed without caching.
+
+    Args:
+        expr (sp.Expr, float, int): the expression
+
+    Returns:
+        str: the C code of the expression
+    """
+    try:
+        hash(expr)
+    except TypeError:
+        return sp.printing.ccode(expr)
+    return _cached_ccode(expr)
+
+
+def _make_expr(expr, degree):
+    """Creates a fenics.Expression from a sympy expression. A new
+    fenics.Expression is returned at each call so that its time can't be
+    modified by another problem. The compiled module is cached by dolfin
+    based on the C code, so the JIT compilation only happens once per
+    expression.
+
+    Args:
+        expr (sp.Expr, float, int): the expression
+        degree (int): the degree of the fenics.Expression
+
+    Returns:
+        fenics.Expression: the expression
+    """
+    return Expression(_ccode(expr), degree=degree, t=0)
+
+
+def as_expression(expr, degree=2):
     # if expr is already a fenics Expression, use it as is
     if isinstance(expr, (Expression, UserExpression)):
         return expr
     # else assume it's a sympy expression
     else:
-        expr_ccode = sp.printing.ccode(expr)
-        return Expression(expr_ccode, degree=2, t=0)
+        return _make_expr(expr, degree)
 
 
 def as_constant(constant):
@@ -34,14 +75,140 @@ def as_constant(constant):
         return Constant(constant)
 
 
-def as_constant_or_expression(val):
+def is_numeric(val):
+    """Checks if a value is a plain number (ie. doesn't depend on space nor
+    time)
+
+    Args:
+        val (float, int, sp.Expr): the value
+
+    Returns:
+        bool: True if val is a number, else False
+    """
+    if isinstance(val, (int, float, np.floating, np.integer)):
+        return True
+    return isinstance(val, sp.Expr) and val.is_number
+
+
+class TimeDependentConstant(Constant):
+    """fenics.Constant whose value only depends on time. The value is
+    evaluated with a numpy function (built with sympy.lambdify) each time
+    .t is set, which is much cheaper than updating a fenics.Expression.
+
+    Args:
+        expr (sp.Expr): the value, can only depend on festim.t
+    """
+
+    def __init__(self, expr):
+        self._function = sp.lambdify(festim.t, expr, modules="numpy")
+        self._t = 0
+        super().__init__(self._evaluate(0))
+
+    def _evaluate(self, t):
+        # numpy floats so that eg. 1/t gives inf instead of raising, since
+        # the numpy version of Piecewise evaluates all the branches
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return float(self._function(np.float64(t)))
+
+    @property
+    def t(self):
+        return self._t
+
+    @t.setter
+    def t(self, value):
+        self._t = value
+        self.assign(self._evaluate(value))
+
+
+class ArrheniusFunction(Function):
+    """fenics.Function holding pre_exp*exp(-E/(k_B*T)) at the boundary dofs
+    of the function space of T. The values are computed from the dofs of T
+    by update() (ie. once per time step, after T has been updated) so that
+    the exponential isn't evaluated at every quadrature point of the
+    surface integrals. The other dofs are left to zero and the function
+    should only be used in surface integrals.
+
+    Args:
+        pre_exp (fenics.Constant): the pre-exponential factor
+        E (fenics.Constant): the activation energy (eV)
+        T (fenics.Function): the temperature (K)
+    """
+
+    def __init__(self, pre_exp, E, T):
+        V = T.function_space()
+        super().__init__(V)
+        self._pre_exp = pre_exp
+        self._E = E
+        self._T = T
+        # dofs on the exterior boundary, the only ones read in ds integrals
+        boundary = DirichletBC(V, Constant(0), "on_boundary")
+        self._dofs = np.array(
+            list(boundary.get_boundary_values().keys()), dtype=np.intc
+        )
+        self.update()
+
+    def update(self):
+        """Computes the values at the boundary dofs with the current T"""
+        T_values = self._T.vector().get_local()[self._dofs]
+        values = self.vector().get_local()
+        values[self._dofs] = float(self._pre_exp) * np.exp(
+            -float(self._E) / festim.k_B / T_values
+        )
+        self.vector().set_local(values)
+        self.vector().apply("insert")
+
+
+def needs_update(expression):
+    """Checks if an expression has to be updated in time (ie. it is not a
+    fenics.Constant with a fixed value)
+
+    Args:
+        expression (fenics.Constant, fenics.Expression,
+            fenics.UserExpression): the expression
+
+    Returns:
+        bool: True if the expression has to be updated, else False
+    """
+    if isinstance(expression, TimeDependentConstant):
+        return True
+    return not isinstance(expression, Constant)
+
+
+def as_constant_or_expression(val, degree=2):
     if isinstance(val, (Constant, Expression, UserExpression)):
         return val
-    elif isinstance(val, (int, float)):
-        return Constant(val)
+    elif is_numeric(val):
+        return Constant(float(val))
+    elif isinstance(val, sp.Expr) and val.free_symbols <= {festim.t}:
+        return TimeDependentConstant(val)
     else:
-        expr_ccode = sp.printing.ccode(val)
-        return Expression(expr_ccode, degree=2, t=0)
+        return _make_expr(val, degree)
+
+
+def compile_expression(function, degree=2, **prms):
+    """Creates a JIT-compiled fenics.Expression from a function of
+    parameters. The function is called with sympy symbols to produce the C
+    code, and the parameters are passed to the fenics.Expression so that the
+    same C code can be reused for different parameter values.
+
+    Args:
+        function (callable): the function, must accept sympy symbols as
+            arguments (eg. use sp.exp instead of np.exp)
+        degree (int, optional): the degree of the fenics.Expression.
+            Defaults to 2.
+        **prms: the parameters of the function (float, int,
+            fenics.Constant, fenics.Expression or fenics.Function). None
+            values are passed to the function as is.
+
+    Returns:
+        fenics.Expression: the compiled expression
+    """
+    symbols = {
+        name: None if value is None else sp.Symbol(name) for name, value in prms.items()
+    }
+    expr_ccode = _ccode(function(**symbols))
+    expression_prms = {name: value for name, value in prms.items() if value is not None}
+    return Expression(expr_ccode, degree=degree, **expression_prms)
 
 
 def kJmol_to_eV(energy):
@@ -70,6 +70,13 @@ class Material:
         self.solubility_law = solubility_law
         self.check_properties()
 
+    @property
+    def ids(self):
+        """list: the ids of the material (ie. self.id as a list)"""
+        if isinstance(self.id, list):
+            return self.id
+        return [self.id]
+
     def check_properties(self):
         """Checks that if S_0 is None E_S is not None and reverse.
 
@@ -216,13 +216,13 @@ class Materials(list):
         Returns:
             festim.Material: the material that has the id mat_id
         """
-        for material in self:
-            mat_ids = material.id
-            if type(mat_ids) is not list:
-                mat_ids = [mat_ids]
-            if mat_id in mat_ids:
-                return material
-        raise ValueError("Couldn't find ID " + str(mat_id) + " in materials list")
+        # the first material with the id takes precedence
+        materials_by_id = {
+            id_: material for material in reversed(self) for id_ in material.ids
+        }
+        if mat_id not in materials_by_id:
+            raise ValueError("Couldn't find ID " + str(mat_id) + " in materials list")
+        return materials_by_id[mat_id]
 
     def find_material_from_name(self, name):
         """Returns the material with the correct name
@@ -260,6 +260,40 @@ class Materials(list):
         elif isinstance(mat, Material):
             return mat
 
+    def property_arrays(self, keys, size=0):
+        """Creates numpy arrays of material properties indexed by subdomain
+        id: arrays[key][mat_id] is the property key of the material with the
+        id mat_id, or NaN if no material has this id. If a property is
+        callable (eg. thermal_cond as a function of T) for one of the
+        materials, its array has the object dtype.
+
+        Args:
+            keys (list): the properties (eg. ["S_0", "E_S"])
+            size (int, optional): minimum size of the arrays. Defaults to 0.
+
+        Returns:
+            dict: the arrays of properties
+        """
+        ids_and_materials = []
+        for material in self:
+            ids_and_materials += [(mat_id, material) for mat_id in material.ids]
+        size = max([size] + [mat_id + 1 for mat_id, _ in ids_and_materials])
+
+        arrays = {}
+        for key in keys:
+            values = [
+                (mat_id, getattr(material, key))
+                for mat_id, material in ids_and_materials
+            ]
+            dtype = float
+            if any(callable(value) for _, value in values):
+                dtype = object
+            arrays[key] = np.full(size, np.nan, dtype=dtype)
+            for mat_id, value in values:
+                if value is not None:
+                    arrays[key][mat_id] = value
+        return arrays
+
     def find_subdomain_from_x_coordinate(self, x):
         """Finds the correct subdomain at a given x coordinate
 
@@ -310,19 +344,30 @@ class Materials(list):
 
     def solubility_as_function(self, mesh, T):
         """
-        Makes solubility as a fenics.Function and stores it in S attribute
+        Makes solubility as a fenics.Function and stores it in S attribute.
+        S is the L2 projection of S_0*exp(-E_S/(k_B*T)) on DG1. The local
+        solver (factorised once) is kept so that S can be updated with
+        update_solubility() when T changes.
         """
         V = f.FunctionSpace(mesh.mesh, "DG", 1)
         S = f.Function(V, name="S")
+        S_trial = f.TrialFunction(V)
         vS = f.TestFunction(V)
         dx = mesh.dx
         F = 0
         for mat in self:
-            F += -S * vS * dx(mat.id)
+            F += -S_trial * vS * dx(mat.id)
             F += mat.S_0 * f.exp(-mat.E_S / k_B / T) * vS * dx(mat.id)
-        f.solve(F == 0, S, bcs=[])
+        # the mass matrix doesn't depend on T and is block diagonal on DG
+        self.solubility_solver = f.LocalSolver(f.lhs(F), f.rhs(F))
+        self.solubility_solver.factorize()
 
         self.S = S
+        self.update_solubility()
+
+    def update_solubility(self):
+        """Projects the solubility with the current temperature in S"""
+        self.solubility_solver.solve_local_rhs(self.S)
 
     def create_solubility_law_markers(self, mesh: festim.Mesh):
         """Creates the attributes henry_marker and sievert_marker
@@ -345,12 +390,7 @@ class Materials(list):
 
         # build the formulation depending on the
         for mat in self:
-            # make sure mat_ids is a list
-            mat_ids = mat.id
-            if not isinstance(mat.id, list):
-                mat_ids = [mat.id]
-
-            for mat_id in mat_ids:  # iterate through the subdomains
+            for mat_id in mat.ids:  # iterate through the subdomains
                 if mat.solubility_law == "henry":
                     F_henry += 1 * test_function_henry * mesh.dx(mat_id)
                 elif mat.solubility_law == "sievert":
@@ -364,22 +404,35 @@ class Materials(list):
         self.sievert_marker = sievert
 
 
+def _property_of(array, subdomain_id):
+    """Returns array[subdomain_id] for an array created by
+    Materials.property_arrays()
+
+    Raises:
+        ValueError: if no material has the id subdomain_id
+    """
+    value = np.nan
+    if subdomain_id < len(array):
+        value = array[subdomain_id]
+    if not callable(value) and np.isnan(value):
+        raise ValueError("Couldn't find ID " + str(subdomain_id) + " in materials list")
+    return value
+
+
 class ArheniusCoeff(f.UserExpression):
     def __init__(self, materials, vm, T, pre_exp, E, **kwargs):
-        super().__init__(kwargs)
+        super().__init__(**kwargs)
         self._vm = vm
         self._T = T
-        self._materials = materials
-        self._pre_exp = pre_exp
-        self._E = E
+        properties = materials.property_arrays([pre_exp, E])
+        self._pre_exp = properties[pre_exp]
+        self._E = properties[E]
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._vm.mesh(), ufc_cell.index)
-        subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
-        D_0 = getattr(material, self._pre_exp)
-        E_D = getattr(material, self._E)
-        value[0] = D_0 * f.exp(-E_D / k_B / self._T(x))
+        subdomain_id = self._vm[ufc_cell.index]
+        D_0 = _property_of(self._pre_exp, subdomain_id)
+        E_D = _property_of(self._E, subdomain_id)
+        value[0] = D_0 * np.exp(-E_D / k_B / self._T(x))
 
     def value_shape(self):
         return ()
@@ -387,17 +440,14 @@ class ArheniusCoeff(f.UserExpression):
 
 class ThermalProp(f.UserExpression):
     def __init__(self, materials, vm, T, key, **kwargs):
-        super().__init__(kwargs)
+        super().__init__(**kwargs)
         self._T = T
         self._vm = vm
-        self._materials = materials
-        self._key = key
+        self._values = materials.property_arrays([key])[key]
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._vm.mesh(), ufc_cell.index)
-        subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
-        attribute = getattr(material, self._key)
+        subdomain_id = self._vm[ufc_cell.index]
+        attribute = _property_of(self._values, subdomain_id)
         if callable(attribute):
             value[0] = attribute(self._T(x))
         else:
@@ -178,10 +178,12 @@ class HeatTransferProblem(festim.Temperature):
                 bc.create_form(self.T, solute=None)
 
                 # TODO: maybe that's not necessary
-                self.sub_expressions += bc.sub_expressions
+                self.sub_expressions += [
+                    expr for expr in bc.sub_expressions if festim.needs_update(expr)
+                ]
 
-                for surf in bc.surfaces:
-                    self.F += -bc.form * self.v_T * mesh.ds(surf)
+                # a single integral over all the surfaces of the BC
+                self.F += -bc.form * self.v_T * mesh.ds(tuple(bc.surfaces))
 
     def create_dirichlet_bcs(self, surface_markers):
         """Creates a list of fenics.DirichletBC and add time dependent
@@ -196,11 +198,14 @@ class HeatTransferProblem(festim.Temperature):
         for bc in self.boundary_conditions:
             if isinstance(bc, festim.DirichletBC) and bc.field == "T":
                 bc.create_expression(self.T)
-                for surf in bc.surfaces:
-                    bci = f.DirichletBC(V, bc.expression, surface_markers, surf)
-                    self.dirichlet_bcs.append(bci)
-                self.sub_expressions += bc.sub_expressions
-                self.sub_expressions.append(bc.expression)
+                markers, marker = bc.merge_surfaces(surface_markers)
+                bci = f.DirichletBC(V, bc.expression, markers, marker)
+                self.dirichlet_bcs.append(bci)
+                self.sub_expressions += [
+                    expr for expr in bc.sub_expressions if festim.needs_update(expr)
+                ]
+                if festim.needs_update(bc.expression):
+                    self.sub_expressions.append(bc.expression)
 
     def update(self, t):
         """Updates T_n, and T with respect to time by solving the heat transfer
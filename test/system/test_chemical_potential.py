@@ -160,3 +160,41 @@ def test_error_raised_when_henry_and_traps():
 
     with pytest.raises(NotImplementedError):
         my_sim.initialise()
+
+
+def test_chemical_pot_transient_temperature():
+    """Checks that with a time dependent temperature, the results with
+    conservation of chemical potential match the ones without it in a single
+    material. With chemical potential, the solubility is the DG1 projection
+    of S_0*exp(-E_S/(k_B*T)) updated at each time step.
+    """
+
+    def run(chemical_pot):
+        my_sim = festim.Simulation()
+        my_sim.mesh = festim.MeshFromVertices(np.linspace(0, 1, num=201))
+        my_sim.materials = festim.Material(id=1, D_0=1, E_D=0.1, S_0=2, E_S=0.2)
+        my_sim.T = festim.Temperature(500 + 100 * festim.x + 1000 * festim.t)
+        my_sim.boundary_conditions = [
+            festim.DirichletBC(surfaces=1, value=1e3, field=0),
+            festim.DirichletBC(surfaces=2, value=1e2, field=0),
+        ]
+        my_sim.settings = festim.Settings(
+            absolute_tolerance=1e-10,
+            relative_tolerance=1e-10,
+            maximum_iterations=50,
+            transient=True,
+            final_time=0.1,
+            chemical_pot=chemical_pot,
+        )
+        my_sim.dt = festim.Stepsize(0.01)
+        my_sim.sources = []
+        my_sim.exports = []
+        my_sim.initialise()
+        my_sim.run()
+        return my_sim.mobile.post_processing_solution
+
+    c_chemical_pot = run(chemical_pot=True)
+    c_reference = run(chemical_pot=False)
+
+    for x in [0.1, 0.25, 0.5, 0.75, 0.9]:
+        assert c_chemical_pot(x) == pytest.approx(c_reference(x), rel=1e-3)
@@ -82,15 +82,14 @@ def test_define_dirichlet_bcs_theta():
         )
 
         # Test that the BCs can be applied to a problem
-        # and gives the correct values
-        fenics.solve(F == 0, u, bcs[0])
+        # and gives the correct values on both surfaces
+        fenics.solve(F == 0, u, bcs)
         assert np.isclose(
-            u(0.25, 0.5),
+            u(0, 0.5),
             (200 + i) / (S_01 * np.exp(-E_S1 / festim.k_B / my_temp.T(0, 0.5))),
         )
-        fenics.solve(F == 0, u, bcs[1])
         assert np.isclose(
-            u(0.75, 0.5),
+            u(1, 0.5),
             (200 + i) / (S_02 * np.exp(-E_S2 / festim.k_B / my_temp.T(1, 0.5))),
         )
 
@@ -273,15 +272,14 @@ def test_bc_recomb_chemical_pot():
         S_right = S_02 * np.exp(-E_S2 / festim.k_B / my_temp.T(1, 0.5))
 
         # Test that the BCs can be applied to a problem
-        # and gives the correct values
-        fenics.solve(F == 0, u, bcs[0])
+        # and gives the correct values on both surfaces
+        fenics.solve(F == 0, u, bcs)
         expected = (phi * R_p / D_left + (phi / K_left) ** 0.5) / S_left
-        computed = u(0.25, 0.5)
+        computed = u(0, 0.5)
         assert np.isclose(expected, computed)
 
-        fenics.solve(F == 0, u, bcs[1])
         expected = (phi * R_p / D_right + (phi / K_right) ** 0.5) / S_right
-        computed = u(0.25, 0.5)
+        computed = u(1, 0.5)
         assert np.isclose(expected, computed)
 
 
@@ -462,6 +460,22 @@ def test_create_expression_dc_custom():
             assert expected(x) == my_BC.expression(x)
 
 
+def test_dc_custom_fenics_function():
+    """Checks that CustomDirichlet works with functions written with fenics
+    operations (not supported by sympy)
+    """
+    T = fenics.Expression("2 + x[0]", degree=1)
+
+    def func(T, prm1):
+        return prm1 * fenics.exp(-1 / T)
+
+    my_bc = festim.CustomDirichlet(surfaces=1, function=func, prm1=3)
+    my_bc.create_expression(T)
+
+    for x in [0, 0.5, 1]:
+        assert my_bc.expression(x) == pytest.approx(3 * np.exp(-1 / (2 + x)))
+
+
 def test_create_form_flux_custom():
     """Creates a flux_custom bc and checks
     create_form returns
@@ -518,6 +532,8 @@ def test_recomb_flux():
 
     my_BC = festim.RecombinationFlux(surfaces=[0], Kr_0=expr, E_Kr=expr, order=2)
     my_BC.create_form(T, c)
+    # Kr is only precomputed when T is a Function and Kr_0, E_Kr are constants
+    assert my_BC.Kr is None
 
 
 def test_mass_flux():
@@ -529,6 +545,27 @@ def test_mass_flux():
     my_BC.create_form(T, c)
 
 
+def test_dirichletbc_several_surfaces():
+    """Checks that a single fenics.DirichletBC is created for a DirichletBC
+    on several surfaces and that it is applied on all of them"""
+    mesh = fenics.UnitIntervalMesh(10)
+    V = fenics.FunctionSpace(mesh, "P", 1)
+
+    surface_markers = fenics.MeshFunction("size_t", mesh, 0, 0)
+    fenics.CompiledSubDomain("near(x[0], 0)").mark(surface_markers, 1)
+    fenics.CompiledSubDomain("near(x[0], 1)").mark(surface_markers, 2)
+
+    bc = festim.DirichletBC(surfaces=[1, 2], value=3, field=0)
+    bc.create_dirichletbc(V, fenics.Constant(1), surface_markers)
+    assert len(bc.dirichlet_bc) == 1
+
+    u = fenics.Function(V)
+    bc.dirichlet_bc[0].apply(u.vector())
+    assert u(0) == pytest.approx(3)
+    assert u(1) == pytest.approx(3)
+    assert u(0.5) == pytest.approx(0)
+
+
 def test_string_for_field_in_dirichletbc():
     """Test catching issue #462"""
     # build
@@ -599,3 +636,32 @@ def test_dissoc_flux():
 
     my_BC = festim.DissociationFlux(surfaces=[0], Kd_0=expr, E_Kd=expr, P=1)
     my_BC.create_form(T, None)
+
+
+@pytest.mark.parametrize(
+    "surfaces,expected",
+    [(1, [1]), (np.int64(2), [2]), ([1, 2], [1, 2]), ((1, 2), [1, 2])],
+)
+def test_bc_surfaces_normalised(surfaces, expected):
+    """Checks that the surfaces of a BC are always stored as a list of int"""
+    my_bc = festim.DirichletBC(surfaces=surfaces, value=1, field="solute")
+    assert my_bc.surfaces == expected
+    assert all(type(surface) is int for surface in my_bc.surfaces)
+    assert my_bc.field == 0
+
+
+@pytest.mark.parametrize("surfaces", [1.5, [1, 2.5], "a"])
+def test_bc_non_integer_surfaces(surfaces):
+    """Checks that an error is raised when the surfaces aren't integers"""
+    with pytest.raises(ValueError):
+        festim.DirichletBC(surfaces=surfaces, value=1, field=0)
+
+
+def test_bc_theta_unknown_subdomain_id():
+    """Checks that an error is raised when a cell doesn't belong to any
+    material with conservation of chemical potential"""
+    mesh = fenics.UnitIntervalMesh(10)
+    vm = fenics.MeshFunction("size_t", mesh, 1, 2)
+    materials = festim.Materials([festim.Material(id=1, D_0=1, E_D=0, S_0=2, E_S=0.1)])
+    with pytest.raises(ValueError, match="Couldn't find ID 2"):
+        festim.BoundaryConditionTheta(fenics.Constant(1), materials, vm, T=None)
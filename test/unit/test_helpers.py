@@ -5,9 +5,25 @@ from festim import (
     as_constant,
     as_expression,
     as_constant_or_expression,
+    is_numeric,
+    compile_expression,
+    TimeDependentConstant,
+    ArrheniusFunction,
+    needs_update,
     t,
+    x,
 )
-from fenics import Constant, Expression, UserExpression
+from fenics import (
+    Constant,
+    Expression,
+    UserExpression,
+    UnitIntervalMesh,
+    FunctionSpace,
+    Function,
+)
+import numpy as np
+import sympy as sp
+import pytest
 
 
 def test_energy_converter():
@@ -46,9 +62,15 @@ def test_as_constant_or_expression():
     assert isinstance(as_constant_or_expression(3.0), Constant)
     assert isinstance(as_constant_or_expression(-2.0), Constant)
     assert isinstance(as_constant_or_expression(Constant(2.0)), Constant)
+    assert isinstance(as_constant_or_expression(np.float64(2.0)), Constant)
+    assert isinstance(as_constant_or_expression(sp.Integer(2) * 3), Constant)
+
+    # time dependent constants
+    assert isinstance(as_constant_or_expression(3 * t), TimeDependentConstant)
+    assert isinstance(as_constant_or_expression(3 * t), Constant)
 
     # expressions
-    assert isinstance(as_constant_or_expression(3 * t), Expression)
+    assert isinstance(as_constant_or_expression(3 * t + x), Expression)
     assert isinstance(
         as_constant_or_expression(Expression("2 + x[0]", degree=2)), Expression
     )
@@ -61,3 +83,114 @@ def test_as_constant_or_expression():
             values[0] = x
 
     assert isinstance(as_constant_or_expression(CustomExpr()), UserExpression)
+
+
+def test_time_dependent_constant():
+    """Checks that TimeDependentConstant is updated when .t is set"""
+    constant = TimeDependentConstant(2 * t + sp.exp(-t))
+    assert float(constant) == pytest.approx(1)
+    for time in [0.5, 1, 10]:
+        constant.t = time
+        assert constant.t == time
+        assert float(constant) == pytest.approx(2 * time + np.exp(-time))
+
+
+def test_time_dependent_constant_singular_at_zero():
+    """Checks that TimeDependentConstant can be built from expressions that
+    are singular at t=0 in one branch or that tend to a finite value"""
+    constant = TimeDependentConstant(sp.Piecewise((1 / t, t > 0), (0, True)))
+    assert float(constant) == 0
+    constant.t = 2
+    assert float(constant) == pytest.approx(0.5)
+
+    constant = TimeDependentConstant(sp.exp(-1 / t))
+    assert float(constant) == 0
+    constant.t = 1
+    assert float(constant) == pytest.approx(np.exp(-1))
+
+
+def test_arrhenius_function():
+    """Checks that ArrheniusFunction is computed from T at the boundary dofs
+    when update() is called"""
+    V = FunctionSpace(UnitIntervalMesh(10), "CG", 1)
+    T = Function(V)
+    T.vector()[:] = 500
+    pre_exp = Constant(2)
+    my_function = ArrheniusFunction(pre_exp, Constant(0.5), T)
+    for x in [0, 1]:
+        assert my_function(x) == pytest.approx(2 * np.exp(-0.5 / k_B / 500))
+
+    T.vector()[:] = 800
+    pre_exp.assign(3)
+    my_function.update()
+    for x in [0, 1]:
+        assert my_function(x) == pytest.approx(3 * np.exp(-0.5 / k_B / 800))
+    # only the boundary dofs are computed
+    assert my_function(0.5) == 0
+
+
+def test_needs_update():
+    assert not needs_update(Constant(2))
+    assert needs_update(TimeDependentConstant(2 * t))
+    assert needs_update(Expression("2 + x[0]", degree=2))
+
+
+def test_ccode_is_memoized():
+    """Checks that the C code of identical sympy expressions is only printed
+    once"""
+    from festim.helpers import _ccode, _cached_ccode
+
+    expr = 3 * t + sp.exp(x)
+    assert _ccode(expr) == sp.printing.ccode(expr)
+    hits = _cached_ccode.cache_info().hits
+    assert _ccode(3 * t + sp.exp(x)) == sp.printing.ccode(expr)
+    assert _cached_ccode.cache_info().hits == hits + 1
+
+    # unhashable inputs are printed without caching
+    assert _ccode([t, 1]) == sp.printing.ccode([t, 1])
+
+
+def test_as_expression_returns_independent_expressions():
+    """Checks that as_expression returns a new fenics.Expression for
+    identical sympy expressions so that their times are independent"""
+    expr_1 = as_expression(2 * t + 1)
+    expr_1.t = 10
+    expr_2 = as_expression(2 * t + 1)
+
+    assert expr_1 is not expr_2
+    assert expr_1.t == 10
+    assert expr_2.t == 0
+    assert expr_1(0) == pytest.approx(21)
+    assert expr_2(0) == pytest.approx(1)
+
+
+def test_is_numeric():
+    assert is_numeric(2)
+    assert is_numeric(-2.5)
+    assert is_numeric(np.float64(2.0))
+    assert is_numeric(sp.sqrt(2) * 3)
+    assert not is_numeric(3 * t)
+    assert not is_numeric(2 + x)
+
+
+def test_compile_expression():
+    """Checks that compile_expression creates a fenics.Expression that
+    evaluates the function with the given parameters"""
+
+    def fun(T, a, b=None):
+        if b is None:
+            return a * sp.exp(-1 / T)
+        return a * sp.exp(-1 / T) + b
+
+    T = Constant(300)
+    expr = compile_expression(fun, T=T, a=2)
+    assert isinstance(expr, Expression)
+    assert expr(0) == pytest.approx(2 * np.exp(-1 / 300))
+
+    T.assign(500)
+    assert expr(0) == pytest.approx(2 * np.exp(-1 / 500))
+
+    b = Expression("3 + t", t=0, degree=1)
+    expr = compile_expression(fun, T=T, a=2, b=b)
+    b.t = 1
+    assert expr(0) == pytest.approx(2 * np.exp(-1 / 500) + 4)
@@ -2,6 +2,7 @@ import festim as F
 from fenics import *
 import pytest
 import warnings
+import numpy as np
 
 
 def test_find_material_from_id():
@@ -26,6 +27,61 @@ def test_find_material_from_id_with_several_ids():
     assert my_Mats.find_material_from_id(2) == mat_1
 
 
+def test_find_material_from_id_after_modifications():
+    """Tests that find_material_from_id() is still correct when the materials
+    list or the ids of the materials are modified between calls
+    """
+    mat_1 = F.Material(id=1, D_0=None, E_D=None)
+    mat_2 = F.Material(id=2, D_0=None, E_D=None)
+    my_Mats = F.Materials([mat_1, mat_2])
+    assert my_Mats.find_material_from_id(2) == mat_2
+
+    mat_3 = F.Material(id=3, D_0=None, E_D=None)
+    my_Mats.append(mat_3)
+    assert my_Mats.find_material_from_id(3) == mat_3
+
+    mat_2.id = 4
+    assert my_Mats.find_material_from_id(4) == mat_2
+    with pytest.raises(ValueError):
+        my_Mats.find_material_from_id(2)
+
+    my_Mats.remove(mat_3)
+    with pytest.raises(ValueError):
+        my_Mats.find_material_from_id(3)
+
+    # the first material with the id is returned
+    mat_1.id = [1, 4]
+    assert my_Mats.find_material_from_id(4) == mat_1
+
+
+def test_find_material_from_id_after_reorder():
+    """Tests that find_material_from_id() returns the first material with
+    the searched id after the materials list is reordered
+    """
+    mat_1 = F.Material(id=1, D_0=None, E_D=None)
+    mat_2 = F.Material(id=[1, 2], D_0=None, E_D=None)
+    my_Mats = F.Materials([mat_1, mat_2])
+    assert my_Mats.find_material_from_id(1) == mat_1
+
+    my_Mats.reverse()
+    assert my_Mats.find_material_from_id(1) == mat_2
+
+    my_Mats.sort(key=lambda mat: len(mat.ids))
+    assert my_Mats.find_material_from_id(1) == mat_1
+
+    my_Mats += [F.Material(id=3, D_0=None, E_D=None)]
+    assert my_Mats.find_material_from_id(3).id == 3
+
+    del my_Mats[0]
+    assert my_Mats.find_material_from_id(1) == mat_2
+
+
+def test_material_ids():
+    """Checks that Material.ids is always a list"""
+    assert F.Material(id=1, D_0=None, E_D=None).ids == [1]
+    assert F.Material(id=[1, 2], D_0=None, E_D=None).ids == [1, 2]
+
+
 def test_find_material_from_id_unfound_id():
     """
     Tests the function find_material_from_id with a list of materials
@@ -280,6 +336,72 @@ def test_create_properties():
         assert S(cell.midpoint().x()) == mf[cell] + 6
 
 
+def test_material_properties_degree():
+    """Checks that the keyword arguments of ArheniusCoeff and ThermalProp
+    (eg. degree) are passed to fenics.UserExpression
+    """
+    mesh = UnitIntervalMesh(10)
+    mf = MeshFunction("size_t", mesh, 1, 1)
+    materials = F.Materials([F.Material(1, D_0=1, E_D=0, thermal_cond=2)])
+    T = Expression("1", degree=1)
+    D = F.materials.materials.ArheniusCoeff(materials, mf, T, "D_0", "E_D", degree=3)
+    thermal_cond = F.materials.materials.ThermalProp(
+        materials, mf, T, "thermal_cond", degree=3
+    )
+    for prop in [D, thermal_cond]:
+        assert prop.ufl_element().degree() == 3
+
+
+def test_update_solubility():
+    """Checks that Materials.update_solubility() updates the solubility
+    function when the temperature changes
+    """
+    mesh = F.MeshFromVertices([0, 0.5, 1])
+    materials = F.Materials([F.Material(1, D_0=1, E_D=0, S_0=2, E_S=0.5)])
+    mesh.define_measures(materials)
+    T = Constant(300)
+    materials.solubility_as_function(mesh, T)
+    S = materials.S
+
+    for T_value in [300, 500]:
+        T.assign(T_value)
+        materials.update_solubility()
+        assert materials.S is S
+        assert S(0.25) == pytest.approx(2 * exp(-0.5 / F.k_B / T_value))
+
+
+def test_property_arrays():
+    """Checks that Materials.property_arrays() returns arrays of properties
+    indexed by subdomain id"""
+    mat_1 = F.Material([1, 3], D_0=1, E_D=0.1, S_0=2, E_S=0.2)
+    mat_2 = F.Material(2, D_0=3, E_D=0.3, S_0=4, E_S=0.4)
+    materials = F.Materials([mat_1, mat_2])
+
+    arrays = materials.property_arrays(["D_0", "E_S"], size=6)
+
+    assert arrays["D_0"].size == 6
+    assert list(arrays["D_0"][1:4]) == [1, 3, 1]
+    assert list(arrays["E_S"][1:4]) == [0.2, 0.4, 0.2]
+    for mat_id in [0, 4, 5]:
+        assert np.isnan(arrays["D_0"][mat_id])
+        assert np.isnan(arrays["E_S"][mat_id])
+
+
+def test_property_arrays_callable():
+    """Checks that Materials.property_arrays() can hold properties given as
+    functions of T"""
+    thermal_cond = lambda T: 2 * T
+    mat_1 = F.Material(1, D_0=1, E_D=0, thermal_cond=thermal_cond)
+    mat_2 = F.Material(2, D_0=1, E_D=0, thermal_cond=3)
+    materials = F.Materials([mat_1, mat_2])
+
+    arrays = materials.property_arrays(["thermal_cond"])
+
+    assert arrays["thermal_cond"][1] is thermal_cond
+    assert arrays["thermal_cond"][2] == 3
+    assert np.isnan(arrays["thermal_cond"][0])
+
+
 def test_E_S_without_S_0():
     with pytest.raises(ValueError, match="S_0 cannot be None"):
         F.Material(1, 1, 1, S_0=None, E_S=1)
@@ -2,6 +2,7 @@ import festim
 import fenics as f
 from ufl.core.multiindex import Index
 import pytest
+import numpy as np
 
 
 def test_mobile_create_diffusion_form():
@@ -277,8 +278,8 @@ class TestInitialise:
 
 
 def test_fluxes():
-    Kr_0 = 2
-    E_Kr = 3
+    Kr_0 = f.Constant(2)
+    E_Kr = f.Constant(3)
     order = 2
     k_B = festim.k_B
 
@@ -303,12 +304,17 @@ def test_fluxes():
 
     test_sol = my_mobile.test_function
     sol = my_mobile.solution
-    Kr_0 = my_mobile.sub_expressions[0]
-    E_Kr = my_mobile.sub_expressions[1]
-    Kr = Kr_0 * f.exp(-E_Kr / k_B / T.T)
+    # constants are not added to sub_expressions
+    assert len(my_mobile.sub_expressions) == 1
+    Kr = my_mobile.boundary_conditions[0].Kr
+    assert isinstance(Kr, festim.ArrheniusFunction)
     expected_form = 0
-    expected_form += -test_sol * (-Kr * (sol) ** order) * f.ds(1)
-    expected_form += -test_sol * my_mobile.sub_expressions[2] * f.ds(1)
-    expected_form += -test_sol * my_mobile.sub_expressions[2] * f.ds(2)
+    expected_form += -test_sol * (-Kr * (sol) ** order) * f.ds((1,))
+    expected_form += -test_sol * my_mobile.sub_expressions[0] * f.ds((1, 2))
     assert expected_form.equals(my_mobile.F)
     assert expected_form.equals(my_mobile.F_fluxes)
+
+    # Kr is computed from T at the boundaries
+    for x in [0, 1]:
+        expected_Kr = float(Kr_0) * np.exp(-float(E_Kr) / k_B / T.T(x))
+        assert Kr(x) == pytest.approx(expected_Kr)
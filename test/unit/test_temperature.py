@@ -90,8 +90,8 @@ def test_formulation_heat_transfer():
     ) * dx(1)
     expected_form += -source * v * dx(1)
 
-    neumann_flux = expressions[1]
-    expected_form += -neumann_flux * v * ds(2)
+    neumann_flux = bc2.form
+    expected_form += -neumann_flux * v * ds((2,))
     assert expected_form.equals(F)
 
 
@@ -170,12 +170,15 @@ class TestCreateTrappingForm:
 
         # test
         v = my_trap.test_function
-        S = self.mat1.S_0 * f.exp(-self.mat1.E_S / festim.k_B / self.my_temp.T)
-        c_0 = mobile.solution * S
-        expected_form = (
+        # the exponentials of k and S are combined
+        k_times_S = (
             -my_trap.k_0
-            * f.exp(-my_trap.E_k / festim.k_B / self.my_temp.T)
-            * c_0
+            * self.mat1.S_0
+            * f.exp(-(my_trap.E_k + self.mat1.E_S) / festim.k_B / self.my_temp.T)
+        )
+        expected_form = (
+            k_times_S
+            * mobile.solution
             * (my_trap.density[0] - my_trap.solution)
             * v
             * self.dx(1)